@@ -1,29 +1,215 @@
 import sys
 import os
-from typing import List, Optional, Dict, Any, TypeVar, Callable
+import argparse
+from typing import List, Optional, Union, Dict, Any, TypeVar, Callable, Iterable, Iterator
 from enum import Enum
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 from dotenv import load_dotenv
-import googleapiclient.discovery
-from googleapiclient.errors import HttpError
-from youtube_transcript_api import YouTubeTranscriptApi
 import re
 import json
+import zlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from pathlib import Path
 import time
-
-# Load environment variables
+import threading
+import queue
+import itertools
+import shutil
+import tempfile
+from functools import lru_cache
+from collections import Counter
+
+# Load environment variables (the heavy API client libraries are imported lazily where first used)
 load_dotenv()
 YOUTUBE_API_KEY = os.getenv('YOUTUBE_API_KEY')
 
+def _positive_int(value: str) -> int:
+    """
+    Parses a command line or environment value that must be a whole number of at least 1.
+
+    Args:
+        value (str): The raw argument value
+
+    Returns:
+        int: The parsed number
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: '{value}'")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+def _env_positive_int(name: str, default: int) -> int:
+    """
+    Reads a whole number of at least 1 from an environment variable.
+    Invalid values are reported and replaced by the default.
+
+    Args:
+        name (str): The environment variable
+        default (int): The value used if the variable is unset or invalid
+
+    Returns:
+        int: The configured number
+    """
+    try:
+        return _positive_int(os.getenv(name, str(default)))
+    except argparse.ArgumentTypeError as e:
+        print(f"Warning: Ignoring {name} ({str(e)}), using {default}", file=sys.stderr)
+        return default
+
+def _language_list(value: str) -> List[str]:
+    """
+    Parses a comma-separated list of language codes, which must name at least one language.
+
+    Args:
+        value (str): The raw argument value
+
+    Returns:
+        List[str]: The language codes in order of preference
+    """
+    languages = [code.strip() for code in value.split(',') if code.strip()]
+    if not languages:
+        raise argparse.ArgumentTypeError(f"no language codes given in '{value}'")
+    return languages
+
 # Constants for API retry
 MAX_RETRIES = 3
 RETRY_DELAY = 5  # seconds
 
+# Number of transcripts downloaded concurrently
+MAX_WORKERS = _env_positive_int('YT_WORKERS', 16)
+
+# Maximum number of YouTube requests started per second across all workers (0 disables)
+REQUESTS_PER_SECOND = float(os.getenv('YT_RATE_LIMIT', '10'))
+
+# Preferred transcript languages, in order of priority
+try:
+    transcript_languages = _language_list(os.getenv('YT_LANGUAGES', 'en'))
+except argparse.ArgumentTypeError as e:
+    print(f"Warning: Ignoring YT_LANGUAGES ({str(e)}), using en", file=sys.stderr)
+    transcript_languages = ['en']
+
+# Default directory transcripts are saved under
+OUTPUT_DIR = Path('transcripts')
+
+# Size of the shared HTTP connection pool, matches the number of workers
+http_pool_size = MAX_WORKERS
+
+# Shared transcript API client, created on first use
+_transcript_api = None
+_transcript_api_lock = threading.Lock()
+
+def get_transcript_api():
+    """
+    Returns the shared transcript API client, creating it on first use.
+    Its requests session reuses pooled keep-alive connections across all workers
+    and retries 429/5xx responses with backoff.
+
+    Returns:
+        YouTubeTranscriptApi: The transcript API client
+    """
+    global _transcript_api
+    with _transcript_api_lock:
+        if _transcript_api is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            from youtube_transcript_api import YouTubeTranscriptApi
+
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(
+                pool_connections=http_pool_size,
+                pool_maxsize=http_pool_size,
+                # Hand the last response back once retries run out, so the library can raise
+                # RequestBlocked for throttling and with_retry can back off further
+                max_retries=Retry(total=MAX_RETRIES, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                                  raise_on_status=False)
+            ))
+            _transcript_api = YouTubeTranscriptApi(http_client=session)
+        return _transcript_api
+
+# On-disk cache of resolved channel IDs and raw transcripts (disable with YT_NO_CACHE=1)
+CACHE_DIR = Path.home() / '.cache' / 'yt_transcript'
+CHANNEL_CACHE_PATH = CACHE_DIR / 'channels.json'
+TRANSCRIPT_CACHE_DIR = CACHE_DIR / 'transcripts'
+TRANSCRIPT_CACHE_TTL = 7 * 24 * 3600  # seconds
+USE_CACHE = not os.getenv('YT_NO_CACHE')
+
+# Process umask, so temporary files renamed into place get the usual permissions
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# File in each channel folder listing the channel's known uploads, for incremental sync
+CHANNEL_INDEX_NAME = '.index.json'
+
+# URL patterns, compiled once at import
+# Standard (/channel/), custom (/c/), handle (/@) and legacy username (/user/) channel URLs in one pass;
+# the name of the matching group selects the resolver
+_CHANNEL_URL_PATTERN = re.compile(
+    r'youtube\.com/(?:channel/(?P<channel_id>UC[\w-]+)|c/(?P<custom_url>[^/]+)'
+    r'|@(?P<handle>[^/]+)|user/(?P<username>[^/]+))'
+)
+
+_CHANNEL_RESOLVERS: Dict[str, Callable[[str], Optional[str]]] = {
+    'channel_id': lambda x: x,
+    'custom_url': lambda x: resolve_custom_url(x),
+    'handle': lambda x: resolve_custom_handle(x),
+    'username': lambda x: resolve_username(x)
+}
+
+# Standard (watch?v=), short (youtu.be), embedded (/v/) and embed (/embed/) video URLs in one pass
+_VIDEO_ID_PATTERN = re.compile(r'(?:youtube\.com/(?:watch\?v=|v/|embed/)|youtu\.be/)([a-zA-Z0-9_-]+)')
+
+# Serializes console output from worker threads so lines do not interleave
+_print_lock = threading.Lock()
+
+def log(message: str) -> None:
+    """
+    Prints a message while holding the console lock.
+
+    Args:
+        message (str): The message to print
+    """
+    with _print_lock:
+        print(message)
+
+class RateLimiter:
+    """Thread-safe token bucket limiting how many requests are started per second."""
+
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Blocks until the caller may start a request."""
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve a token; a negative balance is the caller's wait time
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0
+        if delay > 0:
+            time.sleep(delay)
+
+rate_limiter = RateLimiter(REQUESTS_PER_SECOND)
+
 T = TypeVar('T')
 
 def with_retry[T](func: Callable[[], T]) -> T:
     """
     Decorator to retry API calls with exponential backoff.
+    Every attempt waits for the shared rate limiter first.
 
     Args:
         func: Function to retry
@@ -31,75 +217,321 @@ def with_retry[T](func: Callable[[], T]) -> T:
     Returns:
         T: Result of the function call
     """
+    from googleapiclient.errors import HttpError
+    from youtube_transcript_api import RequestBlocked
+
     for attempt in range(MAX_RETRIES):
+        rate_limiter.acquire()
         try:
             return func()
-        except HttpError as e:
-            if e.resp.status in [429, 500, 503]:  # Rate limit or server error
-                if attempt < MAX_RETRIES - 1:
-                    delay = RETRY_DELAY * (2 ** attempt)  # Exponential backoff
-                    print(f"API rate limit hit or server error. Retrying in {delay} seconds...")
-                    time.sleep(delay)
-                    continue
+        except (HttpError, RequestBlocked) as e:
+            # Rate limit or server error from the Data API, or transcript requests being throttled
+            retryable = isinstance(e, RequestBlocked) or e.resp.status in [429, 500, 502, 503, 504]
+            if retryable and attempt < MAX_RETRIES - 1:
+                delay = RETRY_DELAY * (2 ** attempt)  # Exponential backoff
+                log(f"API rate limit hit or server error. Retrying in {delay} seconds...")
+                time.sleep(delay)
+                continue
             raise
 
+# Shared YouTube Data API client, created on first use
+_youtube = None
+_youtube_lock = threading.Lock()
+
+# Idle HTTP connections for Data API requests; httplib2 connections are not thread-safe,
+# so each request borrows one for exclusive use and returns it for reuse
+_yt_http_pool: queue.SimpleQueue = queue.SimpleQueue()
+
+@lru_cache(maxsize=None)
+def _orjson_model():
+    """
+    Returns a googleapiclient response model that parses API responses with orjson.
+
+    Returns:
+        JsonModel: The response model
+    """
+    from googleapiclient.model import JsonModel
+
+    class OrjsonModel(JsonModel):
+        def deserialize(self, content):
+            try:
+                body = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                return super().deserialize(content)
+            if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+                body = body['data']
+            return body
+
+    return OrjsonModel()
+
+def _yt():
+    """
+    Returns the shared YouTube Data API client, building it on first use.
+    The bundled discovery document is used, so no network fetch is needed, and responses
+    are parsed with orjson when it is installed. Requests built from it must be sent
+    with _execute, which supplies a connection for the calling thread.
+
+    Returns:
+        The YouTube Data API v3 client
+    """
+    global _youtube
+    with _youtube_lock:
+        if _youtube is None:
+            import googleapiclient.discovery
+
+            _youtube = googleapiclient.discovery.build(
+                'youtube', 'v3',
+                developerKey=YOUTUBE_API_KEY,
+                cache_discovery=False,
+                static_discovery=True,
+                model=_orjson_model() if orjson is not None else None
+            )
+        return _youtube
+
+def _execute(request) -> Any:
+    """
+    Sends a Data API request over a pooled keep-alive connection.
+    The connection is used by this thread alone until the request finishes.
+
+    Args:
+        request: The request built from the _yt() client
+
+    Returns:
+        Any: The decoded API response
+    """
+    try:
+        http = _yt_http_pool.get_nowait()
+    except queue.Empty:
+        from googleapiclient.http import build_http
+
+        http = build_http()
+    try:
+        return request.execute(http=http)
+    finally:
+        _yt_http_pool.put(http)
+
 class OutputFormat(Enum):
     """Supported output formats for transcripts."""
     JSON = 'json'
     TXT = 'txt'
     SRT = 'srt'
+    JSON_GZ = 'json.gz'
+
+class DownloadStatus(Enum):
+    """Outcome of a single transcript download."""
+    SUCCESS = 'success'
+    NO_CAPTIONS = 'no_captions'
+    FAILED = 'failed'
+    SKIPPED = 'skipped'
+
+# Output formats in menu order
+_FORMATS = tuple(OutputFormat)
 
 def get_output_format() -> OutputFormat:
     print("\nAvailable output formats:")
-    for i, format in enumerate(OutputFormat, 1):
+    for i, format in enumerate(_FORMATS, 1):
         print(f"{i}. {format.value}")
 
     while True:
         try:
-            choice = int(input("\nSelect output format (1-3): "))
-            if 1 <= choice <= len(OutputFormat):
-                return list(OutputFormat)[choice - 1]
-            print(f"Please enter a number between 1 and {len(OutputFormat)}.")
+            choice = int(input(f"\nSelect output format (1-{len(_FORMATS)}): "))
+            if 1 <= choice <= len(_FORMATS):
+                return _FORMATS[choice - 1]
+            print(f"Please enter a number between 1 and {len(_FORMATS)}.")
         except ValueError:
             print("Please enter a valid number.")
 
-def save_transcript(transcript: List[Dict[str, Any]], output_file: Path, format: OutputFormat) -> None:
+def _dump_json(data: Any) -> bytes:
+    """
+    Serializes data to indented UTF-8 JSON, using orjson when it is installed.
+
+    Args:
+        data (Any): The JSON-serializable data
+
+    Returns:
+        bytes: The encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+def _load_json(path: Path) -> Any:
+    """
+    Reads a JSON file, using orjson when it is installed.
+
+    Args:
+        path (Path): The JSON file
+
+    Returns:
+        Any: The decoded data
+    """
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _srt_timestamp(seconds: float) -> str:
+    """
+    Formats a time offset in the SRT time format (HH:MM:SS,mmm) using integer milliseconds.
+
+    Args:
+        seconds (float): The time offset in seconds
+
+    Returns:
+        str: The formatted timestamp
+    """
+    ms = int(seconds * 1000 + 0.5)
+    h, ms = divmod(ms, 3_600_000)
+    m, ms = divmod(ms, 60_000)
+    s, ms = divmod(ms, 1000)
+    return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
+
+def _json_chunks(transcript: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """
+    Encodes transcript entries one at a time as an indented JSON array.
+
+    Args:
+        transcript (Iterable[Dict[str, Any]]): The transcript entries
+
+    Yields:
+        bytes: Consecutive pieces of the JSON document
+    """
+    empty = True
+    for entry in transcript:
+        yield b"[\n  " if empty else b",\n  "
+        empty = False
+        # JSON strings never contain raw newlines, so this only indents the object's lines
+        yield _dump_json(entry).replace(b"\n", b"\n  ")
+    yield b"[]" if empty else b"\n]"
+
+def _json_gz_chunks(transcript: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """
+    Encodes transcript entries as a gzip-compressed JSON array, compressing as entries arrive.
+
+    Args:
+        transcript (Iterable[Dict[str, Any]]): The transcript entries
+
+    Yields:
+        bytes: Consecutive pieces of the gzip stream
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)  # gzip container
+    for chunk in _json_chunks(transcript):
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+def _txt_chunks(transcript: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """
+    Encodes transcript entries one at a time as plain text lines.
+
+    Args:
+        transcript (Iterable[Dict[str, Any]]): The transcript entries
+
+    Yields:
+        bytes: One line of text per entry
+    """
+    for entry in transcript:
+        yield f"{entry['text']}\n".encode('utf-8')
+
+def _srt_chunks(transcript: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+    """
+    Encodes transcript entries one at a time as SRT subtitle blocks.
+
+    Args:
+        transcript (Iterable[Dict[str, Any]]): The transcript entries
+
+    Yields:
+        bytes: One numbered subtitle block per entry
+    """
+    timestamp = _srt_timestamp
+    for i, entry in enumerate(transcript, 1):
+        start = entry['start']
+        end = start + entry.get('duration', 0)
+        yield f"{i}\n{timestamp(start)} --> {timestamp(end)}\n{entry['text']}\n\n".encode('utf-8')
+
+# Encoder for each output format
+_ENCODERS: Dict[OutputFormat, Callable[[Iterable[Dict[str, Any]]], Iterator[bytes]]] = {
+    OutputFormat.JSON: _json_chunks,
+    OutputFormat.TXT: _txt_chunks,
+    OutputFormat.SRT: _srt_chunks,
+    OutputFormat.JSON_GZ: _json_gz_chunks
+}
+
+def save_transcript(transcript: Iterable[Dict[str, Any]], output_file: Path, format: OutputFormat) -> None:
     """
     Saves the transcript in the specified format.
+    Entries are encoded and streamed one at a time through a buffered temporary file,
+    which is renamed into place, so an interrupted run never leaves a partial transcript behind.
 
     Args:
-        transcript (List[Dict[str, Any]]): The transcript data
+        transcript (Iterable[Dict[str, Any]]): The transcript entries
         output_file (Path): The output file path (without extension)
         format (OutputFormat): The desired output format
     """
-    if format == OutputFormat.JSON:
-        with open(f"{output_file}.json", 'w', encoding='utf-8') as f:
-            json.dump(transcript, f, ensure_ascii=False, indent=2)
+    chunks = _ENCODERS[format](transcript)
 
-    elif format == OutputFormat.TXT:
-        with open(f"{output_file}.txt", 'w', encoding='utf-8') as f:
-            for entry in transcript:
-                f.write(f"{entry['text']}\n")
+    target = Path(f"{output_file}.{format.value}")
+    # A unique temporary name, so concurrent saves of same-titled videos never share a file
+    fd, tmp_name = tempfile.mkstemp(dir=target.parent, prefix=target.name + '.', suffix='.part')
+    tmp_path = Path(tmp_name)
+    try:
+        with open(fd, 'wb') as f:
+            f.writelines(chunks)
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
-    elif format == OutputFormat.SRT:
-        with open(f"{output_file}.srt", 'w', encoding='utf-8') as f:
-            for i, entry in enumerate(transcript, 1):
-                start = entry['start']
-                duration = entry.get('duration', 0)
-                end = start + duration
+_channel_cache: Optional[Dict[str, str]] = None
 
-                # Convert to SRT time format (HH:MM:SS,mmm)
-                start_time = f"{int(start//3600):02d}:{int((start%3600)//60):02d}:{int(start%60):02d},{int((start%1)*1000):03d}"
-                end_time = f"{int(end//3600):02d}:{int((end%3600)//60):02d}:{int(end%60):02d},{int((end%1)*1000):03d}"
+def _load_channel_cache() -> Dict[str, str]:
+    """
+    Loads the channel ID cache from disk on first use.
 
-                f.write(f"{i}\n")
-                f.write(f"{start_time} --> {end_time}\n")
-                f.write(f"{entry['text']}\n\n")
+    Returns:
+        Dict[str, str]: Mapping of normalized channel URL to channel ID
+    """
+    global _channel_cache
+    if _channel_cache is None:
+        try:
+            _channel_cache = _load_json(CHANNEL_CACHE_PATH)
+        except (OSError, ValueError):
+            _channel_cache = {}
+    return _channel_cache
+
+def _write_json_atomic(path: Path, data: Any) -> None:
+    """
+    Writes JSON data through a temporary file so readers never see a partial file.
+
+    Args:
+        path (Path): The destination file
+        data (Any): The JSON-serializable data
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + '.', suffix='.part')
+    tmp_path = Path(tmp_name)
+    try:
+        with open(fd, 'wb') as f:
+            f.write(_dump_json(data))
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+def _save_channel_cache() -> None:
+    """Atomically writes the channel ID cache back to disk."""
+    try:
+        _write_json_atomic(CHANNEL_CACHE_PATH, _load_channel_cache())
+    except OSError as e:
+        print(f"Warning: Could not write channel cache: {str(e)}")
 
 def extract_channel_id(channel_url: str) -> Optional[str]:
     """
     Extracts channel ID from various forms of YouTube channel URLs.
-    Makes an API call if necessary to resolve custom URLs.
+    Previously resolved URLs are answered from the on-disk cache.
 
     Args:
         channel_url (str): The URL of the YouTube channel
@@ -110,25 +542,40 @@ def extract_channel_id(channel_url: str) -> Optional[str]:
     # Clean the URL
     channel_url = channel_url.strip().rstrip('/')
 
+    if not USE_CACHE:
+        return _resolve_channel_id(channel_url)
+
+    cache = _load_channel_cache()
+    if channel_url in cache:
+        return cache[channel_url]
+
+    channel_id = _resolve_channel_id(channel_url)
+    if channel_id:
+        cache[channel_url] = channel_id
+        _save_channel_cache()
+    return channel_id
+
+def _resolve_channel_id(channel_url: str) -> Optional[str]:
+    """
+    Resolves a cleaned YouTube channel URL to a channel ID.
+    Makes an API call if necessary to resolve custom URLs.
+
+    Args:
+        channel_url (str): The cleaned URL of the YouTube channel
+
+    Returns:
+        Optional[str]: The channel ID if found, None otherwise
+    """
     # Try direct ID extraction first
-    patterns = [
-        (r'youtube\.com/channel/(UC[\w-]+)', lambda x: x),  # Standard channel URL
-        (r'youtube\.com/c/([^/]+)', lambda x: resolve_custom_url(x)),  # Custom channel URL
-        (r'youtube\.com/@([^/]+)', lambda x: resolve_custom_handle(x)),  # Handle URL
-        (r'youtube\.com/user/([^/]+)', lambda x: resolve_username(x))  # Legacy username URL
-    ]
-
-    for pattern, resolver in patterns:
-        match = re.search(pattern, channel_url)
-        if match:
-            identifier = match.group(1)
-            try:
-                channel_id = resolver(identifier)
-                if channel_id:
-                    return channel_id
-            except Exception as e:
-                print(f"Error resolving channel identifier '{identifier}': {str(e)}")
-                continue
+    match = _CHANNEL_URL_PATTERN.search(channel_url)
+    if match:
+        identifier = match.group(match.lastgroup)
+        try:
+            channel_id = _CHANNEL_RESOLVERS[match.lastgroup](identifier)
+            if channel_id:
+                return channel_id
+        except Exception as e:
+            print(f"Error resolving channel identifier '{identifier}': {str(e)}")
 
     # If no pattern matches, try resolving the entire URL
     try:
@@ -137,6 +584,7 @@ def extract_channel_id(channel_url: str) -> Optional[str]:
         print(f"Error resolving channel URL: {str(e)}")
         return None
 
+@lru_cache(maxsize=1024)
 def resolve_custom_url(custom_url: str) -> Optional[str]:
     """
     Resolves a custom channel URL to a channel ID using the YouTube API.
@@ -148,14 +596,15 @@ def resolve_custom_url(custom_url: str) -> Optional[str]:
         Optional[str]: The channel ID if found, None otherwise
     """
     try:
-        youtube = googleapiclient.discovery.build('youtube', 'v3', developerKey=YOUTUBE_API_KEY)
+        youtube = _yt()
         request = youtube.search().list(
             part='snippet',
             q=custom_url,
             type='channel',
-            maxResults=1
+            maxResults=1,
+            fields='items/snippet/channelId'
         )
-        response = request.execute()
+        response = with_retry(lambda: _execute(request))
 
         items = response.get('items', [])
         if items:
@@ -164,6 +613,7 @@ def resolve_custom_url(custom_url: str) -> Optional[str]:
     except Exception as e:
         raise Exception(f"Failed to resolve custom URL: {str(e)}")
 
+@lru_cache(maxsize=1024)
 def resolve_custom_handle(handle: str) -> Optional[str]:
     """
     Resolves a channel handle to a channel ID using the YouTube API.
@@ -175,15 +625,16 @@ def resolve_custom_handle(handle: str) -> Optional[str]:
         Optional[str]: The channel ID if found, None otherwise
     """
     try:
-        youtube = googleapiclient.discovery.build('youtube', 'v3', developerKey=YOUTUBE_API_KEY)
+        youtube = _yt()
 
         # First try to get the channel directly using the handle
         def direct_lookup():
             request = youtube.channels().list(
                 part='id',
-                forHandle=handle
+                forHandle=handle,
+                fields='items/id'
             )
-            return request.execute()
+            return _execute(request)
 
         response = with_retry(direct_lookup)
         items = response.get('items', [])
@@ -196,9 +647,10 @@ def resolve_custom_handle(handle: str) -> Optional[str]:
                 part='snippet',
                 q=f"@{handle}",
                 type='channel',
-                maxResults=1
+                maxResults=1,
+                fields='items/snippet/channelId'
             )
-            return request.execute()
+            return _execute(request)
 
         response = with_retry(search_lookup)
         items = response.get('items', [])
@@ -209,9 +661,10 @@ def resolve_custom_handle(handle: str) -> Optional[str]:
             def channel_lookup():
                 request = youtube.channels().list(
                     part='snippet',
-                    id=channel_id
+                    id=channel_id,
+                    fields='items/snippet/customUrl'
                 )
-                return request.execute()
+                return _execute(request)
 
             channel_response = with_retry(channel_lookup)
             channel_items = channel_response.get('items', [])
@@ -225,6 +678,7 @@ def resolve_custom_handle(handle: str) -> Optional[str]:
     except Exception as e:
         raise Exception(f"Failed to resolve handle: {str(e)}")
 
+@lru_cache(maxsize=1024)
 def resolve_username(username: str) -> Optional[str]:
     """
     Resolves a YouTube username to a channel ID using the YouTube API.
@@ -236,12 +690,13 @@ def resolve_username(username: str) -> Optional[str]:
         Optional[str]: The channel ID if found, None otherwise
     """
     try:
-        youtube = googleapiclient.discovery.build('youtube', 'v3', developerKey=YOUTUBE_API_KEY)
+        youtube = _yt()
         request = youtube.channels().list(
             part='id',
-            forUsername=username
+            forUsername=username,
+            fields='items/id'
         )
-        response = request.execute()
+        response = with_retry(lambda: _execute(request))
 
         items = response.get('items', [])
         if items:
@@ -261,14 +716,15 @@ def resolve_channel_url(url: str) -> Optional[str]:
         Optional[str]: The channel ID if found, None otherwise
     """
     try:
-        youtube = googleapiclient.discovery.build('youtube', 'v3', developerKey=YOUTUBE_API_KEY)
+        youtube = _yt()
         request = youtube.search().list(
             part='snippet',
             q=url,
             type='channel',
-            maxResults=1
+            maxResults=1,
+            fields='items/snippet/channelId'
         )
-        response = request.execute()
+        response = with_retry(lambda: _execute(request))
 
         items = response.get('items', [])
         if items:
@@ -277,6 +733,7 @@ def resolve_channel_url(url: str) -> Optional[str]:
     except Exception as e:
         raise Exception(f"Failed to resolve channel URL: {str(e)}")
 
+@lru_cache(maxsize=4096)
 def extract_video_id(video_url: str) -> str:
     """
     Extracts video ID from a YouTube video URL.
@@ -287,96 +744,136 @@ def extract_video_id(video_url: str) -> str:
     Returns:
         str: The video ID
     """
-    patterns = [
-        r'youtube\.com/watch\?v=([a-zA-Z0-9_-]+)',  # Standard video URL
-        r'youtu\.be/([a-zA-Z0-9_-]+)',              # Short URL
-        r'youtube\.com/v/([a-zA-Z0-9_-]+)',         # Embedded URL
-        r'youtube\.com/embed/([a-zA-Z0-9_-]+)'      # Embed URL
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, video_url)
-        if match:
-            return match.group(1)
+    match = _VIDEO_ID_PATTERN.search(video_url)
+    if match:
+        return match.group(1)
 
     return video_url  # Return as is if no pattern matches
 
-def get_channel_videos(channel_id: str) -> List[str]:
+def get_channels_info(channel_ids: List[str]) -> Optional[Dict[str, tuple[str, str, Optional[str]]]]:
     """
-    Gets all video IDs from a YouTube channel.
+    Gets channel names, sanitized folder names and uploads playlists for many channels at once.
+    Looks up 50 IDs per API call.
+
+    Args:
+        channel_ids (List[str]): The channel IDs
+
+    Returns:
+        Optional[Dict[str, tuple[str, str, Optional[str]]]]: Mapping of channel ID to
+            (channel name, sanitized folder name, uploads playlist ID) for every channel found,
+            None if the lookup failed
+    """
+    try:
+        youtube = _yt()
+        channels_info: Dict[str, tuple[str, str, Optional[str]]] = {}
+
+        for batch in itertools.batched(channel_ids, 50):  # Maximum allowed by API
+            request = youtube.channels().list(
+                part='snippet,contentDetails',
+                id=','.join(batch),
+                maxResults=50,
+                fields='items(id,snippet/title,contentDetails/relatedPlaylists/uploads)'
+            )
+            response = with_retry(lambda: _execute(request))
+
+            for item in response.get('items', []):
+                channel_name = item['snippet']['title']
+                # Sanitize folder name by removing invalid characters
+                folder_name = re.sub(r'[<>:"/\\|?*]', '_', channel_name)
+                uploads_id = item['contentDetails']['relatedPlaylists'].get('uploads')
+                channels_info[item['id']] = (channel_name, folder_name, uploads_id)
+
+        return channels_info
+    except Exception as e:
+        print(f"Error getting channel info: {str(e)}")
+        return None
+
+def get_channel_videos(channel_id: str, known_ids: Optional[set[str]] = None,
+                       uploads_id: Optional[str] = None) -> tuple[List[str], bool]:
+    """
+    Gets all video IDs from a YouTube channel, newest first.
+    Pages through the channel's uploads playlist, which costs 1 quota unit per page
+    and, unlike search, is not capped at ~500 results.
 
     Args:
         channel_id (str): The channel ID
+        known_ids (Optional[set[str]]): Video IDs retrieved on a previous run; paging stops
+            at the first known video, so only newer uploads are returned
+        uploads_id (Optional[str]): The channel's uploads playlist ID, looked up if not given
 
     Returns:
-        List[str]: List of video IDs
+        tuple[List[str], bool]: List of unique video IDs, and whether the listing completed without errors
     """
-    youtube = googleapiclient.discovery.build('youtube', 'v3', developerKey=YOUTUBE_API_KEY)
+    youtube = _yt()
 
     video_ids: List[str] = []
+    seen: set[str] = set()
     next_page_token: Optional[str] = None
+    known_ids = known_ids or set()
+
+    if uploads_id is None:
+        channels_info = get_channels_info([channel_id])
+        if channels_info is None:
+            return video_ids, False
+        if channel_id not in channels_info:
+            return video_ids, True
+        uploads_id = channels_info[channel_id][2]
+
+    if not uploads_id:
+        return video_ids, True
 
     while True:
         try:
             # Get channel's uploads with maximum results per page
-            request = youtube.search().list(
-                part='id',
-                channelId=channel_id,
+            request = youtube.playlistItems().list(
+                part='contentDetails',
+                playlistId=uploads_id,
                 maxResults=50,  # Maximum allowed by API
-                type='video',
-                pageToken=next_page_token
+                pageToken=next_page_token,
+                fields='items/contentDetails/videoId,nextPageToken'
             )
 
-            response = request.execute()
+            response = with_retry(lambda: _execute(request))
 
-            # Extract video IDs
-            for item in response.get('items', []):
-                if isinstance(item, dict) and 'id' in item and isinstance(item['id'], dict):
-                    video_id = item['id'].get('videoId')
-                    if video_id:
-                        video_ids.append(video_id)
+            # Extract video IDs, stopping at the first previously seen upload
+            reached_known = False
+            for item in response.get('items', ()):
+                video_id = item['contentDetails']['videoId']
+                if video_id in known_ids:
+                    reached_known = True
+                    break
+                # The same video can appear on more than one page if uploads shift while paging
+                if video_id not in seen:
+                    seen.add(video_id)
+                    video_ids.append(video_id)
 
             # Get next page token
             next_page_token = response.get('nextPageToken')
-            if not next_page_token:
+            if reached_known or not next_page_token:
                 break
 
             print(f"Retrieved {len(video_ids)} videos so far...")
 
         except Exception as e:
             print(f"Error retrieving videos: {str(e)}")
-            break
+            return video_ids, False
 
-    return video_ids
+    return video_ids, True
 
-def get_channel_info(channel_id: str) -> Optional[tuple[str, str]]:
+def _load_channel_index(index_path: Path) -> List[str]:
     """
-    Gets channel name and sanitized folder name from channel ID.
+    Loads the video IDs recorded by a previous run for a channel.
 
     Args:
-        channel_id (str): The channel ID
+        index_path (Path): Path to the channel's index file
 
     Returns:
-        Optional[tuple[str, str]]: Tuple of (channel name, sanitized folder name) if found, None otherwise
+        List[str]: The known video IDs, newest first (empty if there is no index)
     """
     try:
-        youtube = googleapiclient.discovery.build('youtube', 'v3', developerKey=YOUTUBE_API_KEY)
-        request = youtube.channels().list(
-            part='snippet',
-            id=channel_id
-        )
-        response = request.execute()
-
-        items = response.get('items', [])
-        if items:
-            channel_name = items[0]['snippet']['title']
-            # Sanitize folder name by removing invalid characters
-            folder_name = re.sub(r'[<>:"/\\|?*]', '_', channel_name)
-            return channel_name, folder_name
-        return None
-    except Exception as e:
-        print(f"Error getting channel info: {str(e)}")
-        return None
+        return _load_json(index_path).get('video_ids', [])
+    except (OSError, ValueError, AttributeError):
+        return []
 
 def get_video_info(video_id: str) -> Optional[tuple[str, str]]:
     """
@@ -389,12 +886,13 @@ def get_video_info(video_id: str) -> Optional[tuple[str, str]]:
         Optional[tuple[str, str]]: Tuple of (video title, sanitized filename) if found, None otherwise
     """
     try:
-        youtube = googleapiclient.discovery.build('youtube', 'v3', developerKey=YOUTUBE_API_KEY)
+        youtube = _yt()
         request = youtube.videos().list(
             part='snippet',
-            id=video_id
+            id=video_id,
+            fields='items/snippet/title'
         )
-        response = request.execute()
+        response = with_retry(lambda: _execute(request))
 
         items = response.get('items', [])
         if items:
@@ -407,110 +905,383 @@ def get_video_info(video_id: str) -> Optional[tuple[str, str]]:
         print(f"Error getting video info: {str(e)}")
         return None
 
-def download_channel_transcripts(channel_url: str) -> None:
+def _get_videos_batch(video_ids: tuple[str, ...]) -> Dict[str, tuple[str, str]]:
     """
-    Downloads all available transcripts from a YouTube channel.
+    Gets video titles and sanitized filenames for up to 50 videos with one API call.
 
     Args:
-        channel_url (str): The URL of the YouTube channel
+        video_ids (tuple[str, ...]): The video IDs (at most 50)
+
+    Returns:
+        Dict[str, tuple[str, str]]: Mapping of video ID to (video title, sanitized filename)
+    """
+    request = _yt().videos().list(
+        part='snippet',
+        id=','.join(video_ids),
+        maxResults=50,
+        fields='items(id,snippet/title)'
+    )
+    response = with_retry(lambda: _execute(request))
+
+    videos_info: Dict[str, tuple[str, str]] = {}
+    for item in response.get('items', []):
+        video_title = item['snippet']['title']
+        # Sanitize filename by removing invalid characters
+        filename = re.sub(r'[<>:"/\\|?*]', '_', video_title)
+        videos_info[item['id']] = (video_title, filename)
+    return videos_info
+
+def get_videos_info(video_ids: List[str],
+                    workers: int = MAX_WORKERS) -> tuple[Dict[str, tuple[str, str]], set[str]]:
     """
+    Gets video titles and sanitized filenames for many videos at once.
+    Looks up 50 IDs per API call and runs the calls concurrently; IDs missing from
+    the result are private, deleted or invalid. A failed call only affects its own batch.
+
+    Args:
+        video_ids (List[str]): The video IDs
+        workers (int): Maximum number of concurrent API calls
+
+    Returns:
+        tuple[Dict[str, tuple[str, str]], set[str]]: Mapping of video ID to (video title, sanitized filename)
+            for every available video, and the IDs whose lookup failed
+    """
+    batches = list(itertools.batched(video_ids, 50))  # Maximum allowed by API
+    videos_info: Dict[str, tuple[str, str]] = {}
+    failed_ids: set[str] = set()
+
+    def lookup(batch: tuple[str, ...]) -> Optional[Dict[str, tuple[str, str]]]:
+        try:
+            return _get_videos_batch(batch)
+        except Exception as e:
+            log(f"Error getting video info: {str(e)}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(batches)))) as executor:
+        for batch, batch_info in zip(batches, executor.map(lookup, batches)):
+            if batch_info is None:
+                failed_ids.update(batch)
+            else:
+                videos_info.update(batch_info)
+
+    return videos_info, failed_ids
+
+def fetch_transcript(video_id: str) -> List[Dict[str, Any]]:
+    """
+    Fetches a video's transcript in the first available preferred language.
+    Listing the available transcripts and fetching the chosen one happen in a single
+    library call over the shared session.
+
+    Args:
+        video_id (str): The video ID
+
+    Returns:
+        List[Dict[str, Any]]: The transcript entries (text, start, duration)
+    """
+    return with_retry(lambda: get_transcript_api().fetch(video_id, languages=transcript_languages).to_raw_data())
+
+def _cached_fetch_transcript(video_id: str, refresh: bool = False) -> List[Dict[str, Any]]:
+    """
+    Fetches a video's transcript, reusing a copy cached on disk within the last week.
+    Lets reruns in another output format skip the network.
+
+    Args:
+        video_id (str): The video ID
+        refresh (bool): Ignore the cached copy and fetch the transcript again
+
+    Returns:
+        List[Dict[str, Any]]: The transcript entries (text, start, duration)
+    """
+    if not USE_CACHE:
+        return fetch_transcript(video_id)
+
+    cache_path = TRANSCRIPT_CACHE_DIR / f"{video_id}.{'-'.join(transcript_languages)}.json"
+    if not refresh:
+        try:
+            if time.time() - cache_path.stat().st_mtime < TRANSCRIPT_CACHE_TTL:
+                return _load_json(cache_path)
+        except (OSError, ValueError):
+            pass
+
+    transcript = fetch_transcript(video_id)
     try:
-        print(f"\nProcessing channel: {channel_url}")
+        _write_json_atomic(cache_path, transcript)
+    except OSError as e:
+        log(f"Warning: Could not cache transcript for video {video_id}: {str(e)}")
+    return transcript
+
+def clear_cache() -> None:
+    """Deletes all cached channel IDs and transcripts."""
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+    print(f"Cleared cache in {CACHE_DIR}")
+
+def _download_one(video_id: str, video_info: Optional[tuple[str, str]], output_dir: Path,
+                  output_format: OutputFormat, skip_existing: bool = False) -> DownloadStatus:
+    """
+    Downloads and saves the transcript of a single video.
+    Runs inside a worker thread, so errors are reported through the returned status.
 
-        # Extract channel ID
-        channel_id = extract_channel_id(channel_url)
-        if not channel_id:
-            print("Error: Could not extract or resolve channel ID. Please check the URL and try again.")
-            return
+    Args:
+        video_id (str): The video ID
+        video_info (Optional[tuple[str, str]]): Tuple of (video title, sanitized filename), if known
+        output_dir (Path): Directory to save the transcript in
+        output_format (OutputFormat): The desired output format
+        skip_existing (bool): Skip the download if the output file already exists; when False
+            (--force), the transcript is fetched again instead of read from the cache
+
+    Returns:
+        DownloadStatus: The outcome of the download
+    """
+    try:
+        if video_info:
+            video_title, filename = video_info
+            log(f"Processing video: {video_title}")
+        else:
+            log(f"Processing video: {video_id}")
+            filename = video_id
+
+        output_file = output_dir / filename
+        target = Path(f"{output_file}.{output_format.value}")
+        if skip_existing and target.exists() and target.stat().st_size > 0:
+            log(f"Transcript already exists: {output_file}.{output_format.value}")
+            return DownloadStatus.SKIPPED
+
+        transcript = _cached_fetch_transcript(video_id, refresh=not skip_existing)
+
+        # Save transcript in the selected format
+        save_transcript(transcript, output_file, output_format)
+        log(f"Saved transcript to {output_file}.{output_format.value}")
+        return DownloadStatus.SUCCESS
+
+    except Exception as e:
+        from youtube_transcript_api import NoTranscriptFound
+
+        if isinstance(e, NoTranscriptFound):
+            log(f"No captions available for video {video_id} in {', '.join(transcript_languages)}")
+            return DownloadStatus.NO_CAPTIONS
+        log(f"Error downloading transcript for video {video_id}: {str(e)}")
+        return DownloadStatus.FAILED
+
+def _unique_filenames(video_ids: List[str],
+                      videos_info: Dict[str, tuple[str, str]]) -> Dict[str, tuple[str, str]]:
+    """
+    Appends the video ID to filenames shared by several videos, so same-titled videos
+    are saved to separate files.
+
+    Args:
+        video_ids (List[str]): The video IDs to download
+        videos_info (Dict[str, tuple[str, str]]): Mapping of video ID to (video title, sanitized filename)
+
+    Returns:
+        Dict[str, tuple[str, str]]: Mapping of video ID to (video title, unique filename)
+    """
+    # Compare case-insensitively, as on Windows and macOS filesystems
+    name_counts = Counter(videos_info[video_id][1].casefold() for video_id in video_ids if video_id in videos_info)
+
+    unique_info: Dict[str, tuple[str, str]] = {}
+    for video_id in video_ids:
+        if video_id in videos_info:
+            video_title, filename = videos_info[video_id]
+            if name_counts[filename.casefold()] > 1:
+                filename = f"{filename} [{video_id}]"
+            unique_info[video_id] = (video_title, filename)
+    return unique_info
+
+def _run_downloads(video_ids: List[str], videos_info: Dict[str, tuple[str, str]], output_dir: Path,
+                   output_format: OutputFormat, workers: int,
+                   skip_existing: bool = False) -> Dict[DownloadStatus, int]:
+    """
+    Downloads transcripts for many videos in a thread pool.
+    Jobs are submitted lazily with at most two per worker in flight, so memory stays
+    bounded by the worker count rather than the number of videos.
+
+    Args:
+        video_ids (List[str]): The video IDs to download
+        videos_info (Dict[str, tuple[str, str]]): Mapping of video ID to (video title, sanitized filename)
+        output_dir (Path): Directory to save the transcripts in
+        output_format (OutputFormat): The desired output format
+        workers (int): Number of transcripts downloaded concurrently
+        skip_existing (bool): Skip videos whose output file already exists
+
+    Returns:
+        Dict[DownloadStatus, int]: Number of videos per download outcome
+    """
+    counts = {status: 0 for status in DownloadStatus}
+    processed = 0
+    videos_info = _unique_filenames(video_ids, videos_info)
+
+    def collect(futures) -> None:
+        nonlocal processed
+        for future in futures:
+            counts[future.result()] += 1
+            processed += 1
+            log(f"Progress: {processed}/{len(video_ids)} videos processed")
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for video_id in video_ids:
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending.add(executor.submit(
+                _download_one, video_id, videos_info.get(video_id), output_dir, output_format, skip_existing
+            ))
+        collect(as_completed(pending))
+
+    return counts
+
+def download_channel_transcripts(channel_urls: Union[str, List[str]], output_format: Optional[OutputFormat] = None,
+                                 output_root: Path = OUTPUT_DIR, workers: int = MAX_WORKERS,
+                                 force: bool = False) -> bool:
+    """
+    Downloads all available transcripts from one or more YouTube channels.
+
+    Args:
+        channel_urls (Union[str, List[str]]): The URL of a YouTube channel, or a list of channel URLs
+        output_format (Optional[OutputFormat]): The output format, asks the user if None
+        output_root (Path): Directory the channel folders are created in
+        workers (int): Number of transcripts downloaded concurrently
+        force (bool): Download transcripts again even if they were saved before
+
+    Returns:
+        bool: True if any channel has transcripts saved, now or by a previous run
+    """
+    if isinstance(channel_urls, str):
+        channel_urls = [channel_urls]
+
+    try:
+        # Extract channel IDs
+        channel_ids: List[str] = []
+        for channel_url in channel_urls:
+            print(f"\nProcessing channel: {channel_url}")
+
+            channel_id = extract_channel_id(channel_url)
+            if not channel_id:
+                print("Error: Could not extract or resolve channel ID. Please check the URL and try again.")
+                continue
 
-        print(f"Resolved channel ID: {channel_id}")
+            print(f"Resolved channel ID: {channel_id}")
+            channel_ids.append(channel_id)
 
-        # Get channel info
-        channel_info = get_channel_info(channel_id)
+        channel_ids = list(dict.fromkeys(channel_ids))
+        if not channel_ids:
+            return False
+
+        # Get info for all channels, 50 per API call
+        channels_info = get_channels_info(channel_ids) or {}
+
+        # Get output format from user
+        if output_format is None:
+            output_format = get_output_format()
+        print(f"Selected format: {output_format.value}")
+
+        results = [
+            _download_channel(channel_id, channels_info.get(channel_id), output_format, output_root, workers, force)
+            for channel_id in channel_ids
+        ]
+        return any(results)
+
+    except Exception as e:
+        print(f"Error processing channel: {str(e)}")
+        return False
+
+def _download_channel(channel_id: str, channel_info: Optional[tuple[str, str, Optional[str]]],
+                      output_format: OutputFormat, output_root: Path, workers: int, force: bool) -> bool:
+    """
+    Downloads all available transcripts from a single YouTube channel.
+
+    Args:
+        channel_id (str): The channel ID
+        channel_info (Optional[tuple[str, str, Optional[str]]]): Tuple of (channel name,
+            sanitized folder name, uploads playlist ID), if known
+        output_format (OutputFormat): The desired output format
+        output_root (Path): Directory the channel folder is created in
+        workers (int): Number of transcripts downloaded concurrently
+        force (bool): List every upload again and download transcripts even if they were saved before
+
+    Returns:
+        bool: True if any transcript of the channel is saved, now or by a previous run
+    """
+    try:
         if not channel_info:
-            print("Error: Could not get channel information. Using channel ID as folder name.")
+            print(f"\nError: Could not get channel information for {channel_id}. Using channel ID as folder name.")
             channel_name = channel_id
             folder_name = channel_id
+            uploads_id = None
         else:
-            channel_name, folder_name = channel_info
-            print(f"Channel Name: {channel_name}")
+            channel_name, folder_name, uploads_id = channel_info
+            print(f"\nChannel Name: {channel_name}")
 
-        # Get output format from user
-        output_format = get_output_format()
-        print(f"Selected format: {output_format.value}")
+        # Create output directory
+        output_dir = output_root / folder_name
+        output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Get all video IDs from the channel
+        # Get all video IDs from the channel, only paging through uploads newer than the last run
+        # unless a full listing is forced
+        index_path = output_dir / CHANNEL_INDEX_NAME
+        known_ids = _load_channel_index(index_path) if USE_CACHE and not force else []
         try:
-            video_ids = get_channel_videos(channel_id)
+            new_ids, complete = get_channel_videos(channel_id, set(known_ids), uploads_id)
+            video_ids = list(dict.fromkeys(new_ids + known_ids))
             if not video_ids:
                 print("No videos found in the channel. The channel might be private or have no public videos.")
-                return
-            print(f"Found {len(video_ids)} videos")
+                return False
+            print(f"Found {len(video_ids)} videos ({len(new_ids)} new since last run)")
         except Exception as e:
             print(f"Error retrieving videos from channel: {str(e)}")
-            return
+            return False
 
-        # Create output directory
-        output_dir = Path('transcripts') / folder_name
-        output_dir.mkdir(parents=True, exist_ok=True)
+        # Only record a complete listing, otherwise the next run would stop before the gap
+        if USE_CACHE and complete and new_ids:
+            try:
+                _write_json_atomic(index_path, {'video_ids': video_ids})
+            except OSError as e:
+                print(f"Warning: Could not write channel index: {str(e)}")
 
-        # Download transcripts for each video
-        successful = 0
-        failed = 0
-        no_captions = 0
+        # Look up titles in batches and drop videos that are no longer available
+        # (videos whose lookup failed are kept and saved under their video ID)
+        videos_info, failed_ids = get_videos_info(video_ids, workers)
+        available_ids = [video_id for video_id in video_ids if video_id in videos_info or video_id in failed_ids]
+        unavailable = len(video_ids) - len(available_ids)
 
-        for i, video_id in enumerate(video_ids, 1):
-            try:
-                # Get video info
-                video_info = get_video_info(video_id)
-                if video_info:
-                    video_title, filename = video_info
-                    print(f"\nProcessing video {i}/{len(video_ids)}: {video_title}")
-                else:
-                    print(f"\nProcessing video {i}/{len(video_ids)}: {video_id}")
-                    filename = video_id
-
-                transcript = YouTubeTranscriptApi.get_transcript(video_id)
-
-                # Save transcript in the selected format
-                output_file = output_dir / filename
-                save_transcript(transcript, output_file, output_format)
-                print(f"Saved transcript to {output_file}.{output_format.value}")
-                successful += 1
-
-            except Exception as e:
-                error_message = str(e)
-                if "No transcripts were found" in error_message:
-                    print(f"No captions available for video {video_id}")
-                    no_captions += 1
-                else:
-                    print(f"Error downloading transcript for video {video_id}: {error_message}")
-                    failed += 1
-                continue
+        # Download transcripts for each video
+        counts = _run_downloads(available_ids, videos_info, output_dir, output_format, workers,
+                                skip_existing=not force)
 
         # Print summary
         print(f"\nDownload Summary for '{channel_name}':")
         print(f"Total videos found: {len(video_ids)}")
-        print(f"Successfully downloaded: {successful}")
-        print(f"No captions available: {no_captions}")
-        print(f"Failed to download: {failed}")
+        print(f"Successfully downloaded: {counts[DownloadStatus.SUCCESS]}")
+        print(f"Already downloaded: {counts[DownloadStatus.SKIPPED]}")
+        print(f"Unavailable videos: {unavailable}")
+        print(f"No captions available: {counts[DownloadStatus.NO_CAPTIONS]}")
+        print(f"Failed to download: {counts[DownloadStatus.FAILED]}")
         print(f"Transcripts saved in: {output_dir}")
+        return counts[DownloadStatus.SUCCESS] + counts[DownloadStatus.SKIPPED] > 0
 
     except Exception as e:
         print(f"Error processing channel: {str(e)}")
+        return False
 
-def download_single_video_transcript(video_url: str) -> None:
+def download_single_video_transcript(video_url: str, output_format: Optional[OutputFormat] = None,
+                                     output_root: Path = OUTPUT_DIR) -> bool:
     """
     Downloads transcript from a specific YouTube video.
 
     Args:
         video_url (str): The URL of the YouTube video
+        output_format (Optional[OutputFormat]): The output format, asks the user if None
+        output_root (Path): Directory the single_videos folder is created in
+
+    Returns:
+        bool: True if the transcript was saved
     """
     try:
         print(f"\nProcessing video: {video_url}")
 
         # Get output format from user
-        output_format = get_output_format()
+        if output_format is None:
+            output_format = get_output_format()
         print(f"Selected format: {output_format.value}")
 
         # Extract video ID
@@ -528,101 +1299,108 @@ def download_single_video_transcript(video_url: str) -> None:
                 filename = video_id
 
             # Download transcript
-            transcript = YouTubeTranscriptApi.get_transcript(video_id)
+            transcript = _cached_fetch_transcript(video_id)
 
             # Create output directory
-            output_dir = Path('transcripts') / 'single_videos'
+            output_dir = output_root / 'single_videos'
             output_dir.mkdir(parents=True, exist_ok=True)
 
             # Save transcript in the selected format
             output_file = output_dir / filename
             save_transcript(transcript, output_file, output_format)
             print(f"Saved transcript to {output_file}.{output_format.value}")
+            return True
 
         except Exception as e:
             print(f"Error downloading transcript: {str(e)}")
+            return False
 
     except Exception as e:
         print(f"Error processing video: {str(e)}")
+        return False
 
-def download_multiple_video_transcripts(file_path: str) -> None:
+def download_multiple_video_transcripts(file_path: str, output_format: Optional[OutputFormat] = None,
+                                        output_root: Path = OUTPUT_DIR, workers: int = MAX_WORKERS,
+                                        force: bool = False) -> bool:
     """
     Downloads transcripts from multiple YouTube videos listed in a file.
 
     Args:
         file_path (str): Path to the file containing video URLs (one per line)
+        output_format (Optional[OutputFormat]): The output format, asks the user if None
+        output_root (Path): Directory the multiple_videos folder is created in
+        workers (int): Number of transcripts downloaded concurrently
+        force (bool): Download transcripts again even if they were saved before
+
+    Returns:
+        bool: True if any transcript is saved, now or by a previous run
     """
     try:
         # Check if file exists
         if not os.path.exists(file_path):
             print(f"Error: File '{file_path}' does not exist.")
-            return
+            return False
 
         # Get output format from user
-        output_format = get_output_format()
+        if output_format is None:
+            output_format = get_output_format()
         print(f"Selected format: {output_format.value}")
 
         # Create output directory
-        output_dir = Path('transcripts') / 'multiple_videos'
+        output_dir = output_root / 'multiple_videos'
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Read and process video URLs
-        successful = 0
+        # Read video URLs
+        with open(file_path, 'r', encoding='utf-8') as f:
+            # Drop duplicate lines, keeping the first occurrence
+            video_urls = list(dict.fromkeys(line.strip() for line in f if line.strip()))
+        total_videos = len(video_urls)
+
+        if total_videos == 0:
+            print("No video URLs found in the file.")
+            return False
+
+        print(f"\nFound {total_videos} video URLs in the file.")
+
+        # Extract video IDs
         failed = 0
+        video_ids: List[str] = []
 
-        with open(file_path, 'r', encoding='utf-8') as f:
-            video_urls = [line.strip() for line in f if line.strip()]
-            total_videos = len(video_urls)
-
-            if total_videos == 0:
-                print("No video URLs found in the file.")
-                return
-
-            print(f"\nFound {total_videos} video URLs in the file.")
-
-            for i, video_url in enumerate(video_urls, 1):
-                try:
-                    print(f"\nProcessing video {i}/{total_videos}: {video_url}")
-
-                    # Extract video ID
-                    video_id = extract_video_id(video_url)
-                    if not video_id:
-                        print(f"Error: Could not extract video ID from URL: {video_url}")
-                        failed += 1
-                        continue
-
-                    # Get video info
-                    video_info = get_video_info(video_id)
-                    if video_info:
-                        video_title, filename = video_info
-                        print(f"Video Title: {video_title}")
-                    else:
-                        print("Could not get video title. Using video ID as filename.")
-                        filename = video_id
-
-                    # Download transcript
-                    transcript = YouTubeTranscriptApi.get_transcript(video_id)
-
-                    # Save transcript in the selected format
-                    output_file = output_dir / filename
-                    save_transcript(transcript, output_file, output_format)
-                    print(f"Saved transcript to {output_file}.{output_format.value}")
-                    successful += 1
-
-                except Exception as e:
-                    print(f"Error processing video {video_url}: {str(e)}")
-                    failed += 1
-                    continue
+        for video_url in video_urls:
+            video_id = extract_video_id(video_url)
+            if not video_id:
+                print(f"Error: Could not extract video ID from URL: {video_url}")
+                failed += 1
+                continue
+            video_ids.append(video_id)
+
+        # Different URLs may point to the same video
+        video_ids = list(dict.fromkeys(video_ids))
+
+        # Look up titles in batches and drop videos that do not exist
+        # (videos whose lookup failed are kept and saved under their video ID)
+        videos_info, failed_ids = get_videos_info(video_ids, workers)
+        available_ids = [video_id for video_id in video_ids if video_id in videos_info or video_id in failed_ids]
+        unavailable = len(video_ids) - len(available_ids)
+
+        # Download transcripts in parallel
+        counts = _run_downloads(available_ids, videos_info, output_dir, output_format, workers,
+                                skip_existing=not force)
 
         # Print summary
         print(f"\nDownload Summary:")
         print(f"Total videos processed: {total_videos}")
-        print(f"Successfully downloaded: {successful}")
-        print(f"Failed to download: {failed}")
+        print(f"Successfully downloaded: {counts[DownloadStatus.SUCCESS]}")
+        print(f"Already downloaded: {counts[DownloadStatus.SKIPPED]}")
+        print(f"Unavailable videos: {unavailable}")
+        print(f"No captions available: {counts[DownloadStatus.NO_CAPTIONS]}")
+        print(f"Failed to download: {failed + counts[DownloadStatus.FAILED]}")
         print(f"Transcripts saved in: {output_dir}")
+        return counts[DownloadStatus.SUCCESS] + counts[DownloadStatus.SKIPPED] > 0
 
     except Exception as e:
         print(f"Error reading file: {str(e)}")
+        return False
 
 def display_menu() -> None:
     """Displays the main menu of the application."""
@@ -649,15 +1427,77 @@ def get_user_choice() -> int:
         except ValueError:
             print("Please enter a valid number.")
 
+def parse_args() -> argparse.Namespace:
+    """
+    Parses the command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="Download YouTube transcripts. Starts the interactive menu when run without arguments."
+    )
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument('--channel', nargs='+', metavar='URL',
+                      help="Download ALL transcripts from one or more YouTube channel URLs")
+    mode.add_argument('--video', help="Download the transcript of a single YouTube video URL")
+    mode.add_argument('--file', help="Download transcripts for every video URL in a file (one per line)")
+    mode.add_argument('--clear-cache', action='store_true', help="Delete cached channel IDs and transcripts")
+    parser.add_argument('--format', choices=[f.value for f in _FORMATS],
+                        help="Output format (asks interactively if omitted)")
+    parser.add_argument('-j', '--workers', '--number-of-jobs', type=_positive_int, default=str(MAX_WORKERS),
+                        help=f"Number of transcripts downloaded concurrently (default: {MAX_WORKERS})")
+    parser.add_argument('--out-dir', type=Path, default=OUTPUT_DIR,
+                        help=f"Directory to save transcripts in (default: {OUTPUT_DIR})")
+    parser.add_argument('--languages', type=_language_list, default=','.join(transcript_languages),
+                        help=f"Comma-separated transcript languages in order of preference (default: {','.join(transcript_languages)})")
+    parser.add_argument('--force', action='store_true',
+                        help="Download transcripts again even if they already exist or are cached, and list every channel upload again")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Do not read or write the cache of channel IDs, channel videos and transcripts")
+    return parser.parse_args()
+
+def run_cli(args: argparse.Namespace) -> int:
+    """
+    Runs a single download described by the command line arguments.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments
+
+    Returns:
+        int: The process exit status, 1 if no transcript could be saved
+    """
+    global http_pool_size, transcript_languages, USE_CACHE
+
+    output_format = OutputFormat(args.format) if args.format else None
+    http_pool_size = args.workers
+    transcript_languages = args.languages
+    if args.no_cache:
+        USE_CACHE = False
+
+    if args.clear_cache:
+        clear_cache()
+        return 0
+    elif args.channel:
+        succeeded = download_channel_transcripts(args.channel, output_format, args.out_dir, args.workers, args.force)
+    elif args.video:
+        succeeded = download_single_video_transcript(args.video, output_format, args.out_dir)
+    else:
+        succeeded = download_multiple_video_transcripts(args.file, output_format, args.out_dir, args.workers, args.force)
+    return 0 if succeeded else 1
+
 def main():
     """Main application loop."""
+    if len(sys.argv) > 1:
+        sys.exit(run_cli(parse_args()))
+
     while True:
         display_menu()
         choice = get_user_choice()
 
         if choice == 1:
-            channel_url = input("Enter the YouTube channel URL: ")
-            download_channel_transcripts(channel_url)
+            channel_urls = input("Enter the YouTube channel URL (separate several with commas): ")
+            download_channel_transcripts([url for url in channel_urls.split(',') if url.strip()])
 
         elif choice == 2:
             video_url = input("Enter the YouTube video URL: ")